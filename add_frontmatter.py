@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Add YAML frontmatter to skills that don't have it."""
 
+import os
 import re
 from pathlib import Path
 
@@ -20,20 +21,26 @@ def extract_description(content: str) -> str:
     description_lines = []
     in_description = False
 
-    for line in lines:
+    for raw in lines:
+        line = raw.strip()
+
         # Skip the title
         if line.startswith("# "):
             in_description = True
             continue
 
-        if in_description:
-            # Stop at next heading or empty line after content
-            if line.startswith("#"):
-                break
-            if line.strip() == "" and description_lines:
+        if not in_description:
+            continue
+
+        # Stop at next heading or empty line after content
+        if line.startswith("#"):
+            break
+        if not line:
+            if description_lines:
                 break
-            if line.strip():
-                description_lines.append(line.strip())
+            continue
+
+        description_lines.append(line)
 
     description = " ".join(description_lines)
 
@@ -84,15 +91,16 @@ def main():
     updated = 0
     skipped = 0
 
-    for skill_dir in SKILLS_DIR.iterdir():
-        if not skill_dir.is_dir():
-            continue
+    with os.scandir(SKILLS_DIR) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
 
-        if add_frontmatter(skill_dir):
-            print(f"✓ Updated: {skill_dir.name}")
-            updated += 1
-        else:
-            skipped += 1
+            if add_frontmatter(Path(entry.path)):
+                print(f"✓ Updated: {entry.name}")
+                updated += 1
+            else:
+                skipped += 1
 
     print(f"\nDone! Updated {updated} skills, skipped {skipped} (already had frontmatter)")
 
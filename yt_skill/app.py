@@ -3,28 +3,41 @@
 import asyncio
 import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
 from textual.widgets import (
-    Header, Footer, Static, Input, Button,
-    ProgressBar, Label, ListItem, ListView
+    Header, Footer, Static, Input, Button, ProgressBar
 )
 from textual.binding import Binding
 from textual.message import Message
 from textual import work
 
 from .youtube import (
-    get_channel_videos, get_video_info, get_transcript,
+    iter_channel_videos, get_video_info, get_transcript,
     format_duration, format_views, VideoInfo
 )
 from .skills import (
-    extract_skill, generate_skill_name, save_skill,
-    list_existing_skills, SKILLS_DIR
+    extract_skills_batch, generate_skill_name, save_skill,
+    list_existing_skills
 )
 
 
+# Transcripts sent to Claude per CLI invocation
+EXTRACTION_BATCH_SIZE = 4
+
+# yt-dlp transcript downloads allowed in flight at once
+FETCH_CONCURRENCY = 4
+
+
+async def stream_channel_videos(url: str, limit: int) -> AsyncIterator[VideoInfo]:
+    """Yield channel videos without blocking the event loop between lines."""
+    videos = iter_channel_videos(url, limit)
+    while (video := await asyncio.to_thread(next, videos, None)) is not None:
+        yield video
+
+
 ASCII_LOGO = """
 [bold cyan]██╗   ██╗████████╗    ███████╗██╗  ██╗██╗██╗     ██╗
 ╚██╗ ██╔╝╚══██╔══╝    ██╔════╝██║ ██╔╝██║██║     ██║
@@ -39,6 +52,19 @@ ASCII_LOGO = """
 class VideoCard(Container):
     """Display a video with its info and processing status."""
 
+    _STATUS_COLORS = {
+        "pending": "white",
+        "processing": "yellow",
+        "done": "green",
+        "error": "red"
+    }
+    _STATUS_TEXT = {
+        "pending": "Ready",
+        "processing": "Analyzing with AI...",
+        "done": "Skill extracted!",
+        "error": "Failed"
+    }
+
     class Selected(Message):
         def __init__(self, video: VideoInfo) -> None:
             self.video = video
@@ -48,29 +74,17 @@ class VideoCard(Container):
         super().__init__(**kwargs)
         self.video = video
         self.status = "pending"  # pending, processing, done, error
+        self._title_display = video.title[:50] + "..." if len(video.title) > 50 else video.title
 
     def compose(self) -> ComposeResult:
         yield Static(self._render_content(), id="video-content")
 
     def _render_content(self) -> str:
-        status_colors = {
-            "pending": "white",
-            "processing": "yellow",
-            "done": "green",
-            "error": "red"
-        }
-        status_text = {
-            "pending": "Ready",
-            "processing": "Analyzing with AI...",
-            "done": "Skill extracted!",
-            "error": "Failed"
-        }
-        color = status_colors[self.status]
-        title = self.video.title[:50] + "..." if len(self.video.title) > 50 else self.video.title
-
-        return f"""[bold]{title}[/bold]
+        color = self._STATUS_COLORS[self.status]
+
+        return f"""[bold]{self._title_display}[/bold]
 [dim]{format_duration(self.video.duration)} | {format_views(self.video.view_count)} views[/dim]
-[{color}]{status_text[self.status]}[/{color}]"""
+[{color}]{self._STATUS_TEXT[self.status]}[/{color}]"""
 
     def update_status(self, status: str) -> None:
         self.status = status
@@ -196,6 +210,7 @@ class YTSkillApp(App):
         self.videos: list[VideoInfo] = []
         self.current_channel = ""
         self.processing = False
+        self._card_by_id: dict[str, VideoCard] = {}
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -245,41 +260,65 @@ class YTSkillApp(App):
                 video = await asyncio.to_thread(get_video_info, url)
                 self.videos = [video]
                 self.current_channel = video.channel
+                self._update_video_list()
             else:
-                self.videos = await asyncio.to_thread(get_channel_videos, url, 50)
-                # Extract channel name from URL if not in video data
-                if self.videos:
-                    self.current_channel = self.videos[0].channel
-                    if not self.current_channel or self.current_channel == "Unknown":
-                        # Try to extract from URL
-                        if "/@" in url:
-                            self.current_channel = url.split("/@")[1].split("/")[0]
-                        elif "/c/" in url:
-                            self.current_channel = url.split("/c/")[1].split("/")[0]
-                        else:
-                            self.current_channel = "YouTube Channel"
-
-            self._update_video_list()
+                self.videos = []
+                self._clear_video_list()
+
+                # Mount each card as yt-dlp reports it
+                async for video in stream_channel_videos(url, 50):
+                    if not self.videos:
+                        # Extract channel name from URL if not in video data
+                        self.current_channel = video.channel
+                        if not self.current_channel or self.current_channel == "Unknown":
+                            # Try to extract from URL
+                            if "/@" in url:
+                                self.current_channel = url.split("/@")[1].split("/")[0]
+                            elif "/c/" in url:
+                                self.current_channel = url.split("/c/")[1].split("/")[0]
+                            else:
+                                self.current_channel = "YouTube Channel"
+
+                    self.videos.append(video)
+                    self._mount_video_card(video)
+                    self._update_channel_info()
+
+                if not self.videos:
+                    self._update_channel_info()
+
             self.set_status(f"Loaded {len(self.videos)} videos. Press 'Process All' to start.")
 
         except Exception as e:
             self.query_one("#channel-info", Static).update(f"[red]Error: {e}[/red]")
             self.set_status(f"Error: {e}")
 
-    def _update_video_list(self) -> None:
-        """Update the video list display."""
+    def _update_channel_info(self) -> None:
+        """Update the channel header above the video list."""
         channel_info = self.query_one("#channel-info", Static)
         channel_info.update(
             f"[bold cyan]Channel: {self.current_channel}[/bold cyan]\n"
             f"{len(self.videos)} videos to process"
         )
 
-        video_list = self.query_one("#video-list", ScrollableContainer)
-        video_list.remove_children()
+    def _update_video_list(self) -> None:
+        """Update the video list display."""
+        self._update_channel_info()
+
+        self._clear_video_list()
 
         for video in self.videos:
-            card = VideoCard(video, classes="video-card")
-            video_list.mount(card)
+            self._mount_video_card(video)
+
+    def _clear_video_list(self) -> None:
+        """Remove all video cards."""
+        self.query_one("#video-list", ScrollableContainer).remove_children()
+        self._card_by_id = {}
+
+    def _mount_video_card(self, video: VideoInfo) -> None:
+        """Add a card for a video to the video list."""
+        card = VideoCard(video, classes="video-card")
+        self.query_one("#video-list", ScrollableContainer).mount(card)
+        self._card_by_id[video.id] = card
 
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "process-btn":
@@ -297,77 +336,70 @@ class YTSkillApp(App):
 
         progress = self.query_one("#progress", ProgressBar)
         total = len(self.videos)
+        finished = 0
         completed = 0
         errors = 0
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
+        sem = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+        async def fetch(
+            video: VideoInfo, tmp_path: Path
+        ) -> Optional[tuple[VideoInfo, Optional[VideoCard], str]]:
+            """Fetch one transcript, marking the card failed if there is none."""
+            nonlocal finished, errors
 
-            for i, video in enumerate(self.videos):
+            async with sem:
                 if not self.processing:
-                    self.set_status("Stopped by user.")
-                    break
-
-                # Update progress
-                pct = ((i + 1) / total) * 100
-                progress.update(progress=pct)
-                self.set_status(f"[{i+1}/{total}] Fetching transcript: {video.title[:40]}...")
-
-                # Find the video card
-                cards = self.query(VideoCard)
-                card = None
-                for c in cards:
-                    if c.video.id == video.id:
-                        card = c
-                        break
+                    return None
 
-                if card:
-                    card.update_status("processing")
+                # Cards stay pending until their batch goes to Claude
+                card = self._card_by_id.get(video.id)
 
+                self.set_status(f"Fetching transcript: {video.title[:40]}...")
                 try:
-                    # Get transcript
                     transcript = await asyncio.to_thread(
                         get_transcript, video.url, tmp_path / video.id
                     )
-
                     if not transcript:
-                        self.set_status(f"[{i+1}/{total}] No transcript available for: {video.title[:40]}")
-                        if card:
-                            card.update_status("error")
-                        errors += 1
-                        continue
-
-                    # Extract skill
-                    self.set_status(f"[{i+1}/{total}] Extracting skill with Claude: {video.title[:40]}...")
-                    skill_content = await asyncio.to_thread(
-                        extract_skill,
-                        transcript,
-                        video.title,
-                        video.channel
-                    )
-
-                    if skill_content:
-                        skill_name = generate_skill_name(video.title)
-                        save_skill(skill_content, skill_name)
+                        self.set_status(f"No transcript available for: {video.title[:40]}")
+                except Exception as e:
+                    self.log.error(f"Error processing {video.title}: {e}")
+                    self.set_status(f"Error: {str(e)[:50]}")
+                    transcript = None
 
-                        self.query_one(SkillList).add_skill(skill_name)
-                        self.set_status(f"[{i+1}/{total}] Skill saved: {skill_name}")
+            if not transcript:
+                if card:
+                    card.update_status("error")
+                errors += 1
+                finished += 1
+                progress.update(progress=(finished / total) * 100)
+                return None
 
-                        if card:
-                            card.update_status("done")
-                        completed += 1
-                    else:
-                        self.set_status(f"[{i+1}/{total}] No skill extracted from: {video.title[:40]}")
-                        if card:
-                            card.update_status("error")
-                        errors += 1
+            return video, card, transcript
 
-                except Exception as e:
-                    self.log.error(f"Error processing {video.title}: {e}")
-                    self.set_status(f"[{i+1}/{total}] Error: {str(e)[:50]}")
+        # Fetch transcripts concurrently; each one is an IO-bound yt-dlp run
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            fetched = await asyncio.gather(
+                *[fetch(video, tmp_path) for video in self.videos]
+            )
+
+        # Extract skills from the fetched transcripts in batches
+        pending = [item for item in fetched if item]
+        for start in range(0, len(pending), EXTRACTION_BATCH_SIZE):
+            if not self.processing:
+                self.set_status("Stopped by user.")
+                for _, card, _ in pending[start:]:
                     if card:
-                        card.update_status("error")
-                    errors += 1
+                        card.update_status("pending")
+                break
+
+            batch = pending[start:start + EXTRACTION_BATCH_SIZE]
+            done, failed = await self._extract_batch(batch)
+            completed += done
+            errors += failed
+            finished += len(batch)
+            progress.update(progress=(finished / total) * 100)
 
         progress.update(progress=100)
         self.processing = False
@@ -375,6 +407,55 @@ class YTSkillApp(App):
         self.query_one("#stop-btn", Button).disabled = True
         self.set_status(f"Done! {completed} skills extracted, {errors} errors.")
 
+    async def _extract_batch(
+        self, batch: list[tuple[VideoInfo, Optional[VideoCard], str]]
+    ) -> tuple[int, int]:
+        """Extract and save skills for a batch of transcripts with one Claude call."""
+        completed = 0
+        errors = 0
+
+        for _, card, _ in batch:
+            if card:
+                card.update_status("processing")
+
+        self.set_status(f"Extracting {len(batch)} skills with Claude...")
+        try:
+            results = await asyncio.to_thread(
+                extract_skills_batch,
+                [(transcript, video.title, video.channel) for video, _, transcript in batch]
+            )
+        except Exception as e:
+            self.log.error(f"Error extracting skills: {e}")
+            self.set_status(f"Error: {str(e)[:50]}")
+            results = [None] * len(batch)
+
+        for (video, card, _), skill_content in zip(batch, results):
+            try:
+                if skill_content:
+                    skill_name = generate_skill_name(video.title)
+                    save_skill(skill_content, skill_name)
+
+                    self.query_one(SkillList).add_skill(skill_name)
+                    self.set_status(f"Skill saved: {skill_name}")
+
+                    if card:
+                        card.update_status("done")
+                    completed += 1
+                else:
+                    self.set_status(f"No skill extracted from: {video.title[:40]}")
+                    if card:
+                        card.update_status("error")
+                    errors += 1
+
+            except Exception as e:
+                self.log.error(f"Error processing {video.title}: {e}")
+                self.set_status(f"Error: {str(e)[:50]}")
+                if card:
+                    card.update_status("error")
+                errors += 1
+
+        return completed, errors
+
     def action_refresh(self) -> None:
         self.query_one(SkillList).refresh_skills()
 
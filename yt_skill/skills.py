@@ -1,5 +1,6 @@
 """Skill extraction using Claude CLI."""
 
+import os
 import subprocess
 import re
 from pathlib import Path
@@ -8,6 +9,41 @@ from typing import Optional
 
 SKILLS_DIR = Path.home() / ".claude" / "skills"
 
+SKILL_FORMAT = """```markdown
+---
+name: skill-name-in-kebab-case
+description: A concise description (1-2 sentences) of what this skill does and when Claude should use it. This is used for automatic skill matching.
+---
+
+# [Skill Name]
+
+[One paragraph description of what this skill does and when to use it]
+
+## When to Use This Skill
+
+- [Bullet points of scenarios when this skill applies]
+
+## Instructions
+
+[Step-by-step instructions for Claude to follow when using this skill. Be specific and actionable.]
+
+### Step 1: [Step Name]
+[Details]
+
+### Step 2: [Step Name]
+[Details]
+
+[Continue as needed]
+
+## Examples
+
+[Optional: Include 1-2 concrete examples if they help clarify the skill]
+
+## Tips
+
+- [Any important tips, gotchas, or best practices mentioned in the video]
+```"""
+
 EXTRACTION_PROMPT = """You are analyzing a YouTube video transcript to extract actionable skills, methodologies, and techniques that can be turned into a Claude Code skill.
 
 A Claude Code skill is a markdown file (SKILL.md) that teaches Claude how to perform a specific task. Skills should be:
@@ -28,42 +64,88 @@ Based on this video, extract the most valuable skill or methodology being taught
 
 Output a complete SKILL.md file with YAML frontmatter in this format:
 
-```markdown
----
-name: skill-name-in-kebab-case
-description: A concise description (1-2 sentences) of what this skill does and when Claude should use it. This is used for automatic skill matching.
+""" + SKILL_FORMAT + """
+
+Only output the markdown content, nothing else. If the video doesn't contain any actionable skill or methodology worth extracting, output: NO_SKILL_FOUND"""
+
+BATCH_EXTRACTION_PROMPT = """You are analyzing several YouTube video transcripts to extract actionable skills, methodologies, and techniques that can be turned into Claude Code skills.
+
+A Claude Code skill is a markdown file (SKILL.md) that teaches Claude how to perform a specific task. Skills should be:
+- Actionable and specific
+- Have clear step-by-step instructions
+- Include examples where helpful
+- Be reusable across different contexts
+
+Each video is delimited by a <<<VIDEO i=N>>> line and a <<<END>>> line.
+
+{videos}
+
 ---
 
-# [Skill Name]
+Treat every video independently. For each one, extract the most valuable skill or methodology being taught. If a video covers multiple distinct skills, focus on the primary/most important one.
 
-[One paragraph description of what this skill does and when to use it]
+For each video, output a complete SKILL.md file with YAML frontmatter in this format:
 
-## When to Use This Skill
+""" + SKILL_FORMAT + """
 
-- [Bullet points of scenarios when this skill applies]
+Wrap each SKILL.md in a <<<SKILL i=N>>> line and a <<<END>>> line, where N matches the video's number. Output one block per video and nothing outside the blocks. If a video doesn't contain any actionable skill or methodology worth extracting, output NO_SKILL_FOUND as that video's block content."""
 
-## Instructions
+BATCH_VIDEO_TEMPLATE = """<<<VIDEO i={index}>>>
+VIDEO TITLE: {title}
+CHANNEL: {channel}
 
-[Step-by-step instructions for Claude to follow when using this skill. Be specific and actionable.]
+TRANSCRIPT:
+{transcript}
+<<<END>>>"""
 
-### Step 1: [Step Name]
-[Details]
+_SKILL_BLOCK_RE = re.compile(r"<<<SKILL i=(\d+)>>>(.*?)<<<END>>>", re.S)
 
-### Step 2: [Step Name]
-[Details]
+# Optional leading ``` or ```markdown fence and optional trailing ``` fence
+_FENCE_RE = re.compile(r"\A(?:```(?:markdown)?\n?)?(.*?)(?:\n?```)?\Z", re.S)
 
-[Continue as needed]
+# Patterns used by generate_skill_name
+_PREFIX_RE = re.compile(r'^(how to|how i|my|the|a|an)\s+')
+_SUFFIX_RE = re.compile(r'\s+(tutorial|guide|explained|walkthrough)$')
+_NONWORD_RE = re.compile(r'[^\w\s-]')
+_DASH_RE = re.compile(r'[-\s]+')
 
-## Examples
 
-[Optional: Include 1-2 concrete examples if they help clarify the skill]
+# Transcript characters per Claude call (~100k chars for context)
+MAX_TRANSCRIPT_CHARS = 100_000
 
-## Tips
 
-- [Any important tips, gotchas, or best practices mentioned in the video]
-```
+def _truncate_transcript(transcript: str, max_chars: int = MAX_TRANSCRIPT_CHARS) -> str:
+    """Truncate a transcript to fit the prompt."""
+    if len(transcript) > max_chars:
+        transcript = transcript[:max_chars] + "\n\n[Transcript truncated...]"
+    return transcript
 
-Only output the markdown content, nothing else. If the video doesn't contain any actionable skill or methodology worth extracting, output: NO_SKILL_FOUND"""
+
+def _run_claude(prompt: str, timeout: int) -> str:
+    """Run a prompt through the Claude CLI and return its output."""
+    # Call claude CLI with -p (print mode) for non-interactive output.
+    # The prompt goes in on stdin so long transcripts never hit ARG_MAX.
+    result = subprocess.run(
+        ["claude", "-p"],
+        input=prompt,
+        capture_output=True,
+        text=True,
+        timeout=timeout
+    )
+    return result.stdout
+
+
+def _clean_skill_content(content: str) -> Optional[str]:
+    """Strip code fences from Claude's output, or None if no skill was found."""
+    content = content.strip()
+
+    if not content or "NO_SKILL_FOUND" in content:
+        return None
+
+    # Clean up markdown code blocks if present
+    content = _FENCE_RE.match(content).group(1)
+
+    return content.strip()
 
 
 def extract_skill(
@@ -75,52 +157,73 @@ def extract_skill(
     Use Claude CLI to extract a skill from a video transcript.
     Returns the SKILL.md content or None if no skill found.
     """
-    # Truncate transcript if too long (keep ~100k chars for context)
-    max_chars = 100_000
-    if len(transcript) > max_chars:
-        transcript = transcript[:max_chars] + "\n\n[Transcript truncated...]"
-
     prompt = EXTRACTION_PROMPT.format(
         title=title,
         channel=channel,
-        transcript=transcript
+        transcript=_truncate_transcript(transcript)
     )
 
-    # Call claude CLI with -p (print mode) for non-interactive output
-    # Using stdin to pass long prompts safely
-    result = subprocess.run(
-        ["claude", "-p", prompt],
-        capture_output=True,
-        text=True,
-        timeout=300  # 5 min timeout for long transcripts
+    # 5 min timeout for long transcripts
+    return _clean_skill_content(_run_claude(prompt, timeout=300))
+
+
+def extract_skills_batch(
+    items: list[tuple[str, str, str]],
+) -> list[Optional[str]]:
+    """
+    Use a single Claude CLI call to extract skills from several transcripts.
+    Takes (transcript, title, channel) tuples and returns the SKILL.md
+    content (or None) for each, in the same order. Videos whose block is
+    missing from the output are retried one at a time with extract_skill.
+    """
+    if not items:
+        return []
+    if len(items) == 1:
+        return [extract_skill(*items[0])]
+
+    # The transcripts share one call's budget
+    max_chars = MAX_TRANSCRIPT_CHARS // len(items)
+    videos = "\n\n".join(
+        BATCH_VIDEO_TEMPLATE.format(
+            index=i,
+            title=title,
+            channel=channel,
+            transcript=_truncate_transcript(transcript, max_chars)
+        )
+        for i, (transcript, title, channel) in enumerate(items)
     )
+    prompt = BATCH_EXTRACTION_PROMPT.format(videos=videos)
 
-    content = result.stdout.strip()
+    # 5 min per transcript, as in extract_skill
+    output = _run_claude(prompt, timeout=300 * len(items))
 
-    if not content or "NO_SKILL_FOUND" in content:
-        return None
+    skills: list[Optional[str]] = [None] * len(items)
+    matched = set()
+    for match in _SKILL_BLOCK_RE.finditer(output):
+        index = int(match.group(1))
+        if 0 <= index < len(items):
+            skills[index] = _clean_skill_content(match.group(2))
+            matched.add(index)
 
-    # Clean up markdown code blocks if present
-    if content.startswith("```markdown"):
-        content = content[11:]
-    if content.startswith("```"):
-        content = content[3:]
-    if content.endswith("```"):
-        content = content[:-3]
+    # A missing block means the batch output was cut short or malformed,
+    # not that the video had no skill, so give those videos their own call
+    for i in range(len(items)):
+        if i not in matched:
+            skills[i] = extract_skill(*items[i])
 
-    return content.strip()
+    return skills
 
 
 def generate_skill_name(title: str) -> str:
     """Generate a kebab-case skill name from video title."""
     # Remove common prefixes/suffixes
     name = title.lower()
-    name = re.sub(r'^(how to|how i|my|the|a|an)\s+', '', name)
-    name = re.sub(r'\s+(tutorial|guide|explained|walkthrough)$', '', name)
+    name = _PREFIX_RE.sub('', name)
+    name = _SUFFIX_RE.sub('', name)
 
     # Convert to kebab-case
-    name = re.sub(r'[^\w\s-]', '', name)
-    name = re.sub(r'[-\s]+', '-', name)
+    name = _NONWORD_RE.sub('', name)
+    name = _DASH_RE.sub('-', name)
     name = name.strip('-')
 
     # Limit length
@@ -136,7 +239,10 @@ def save_skill(skill_content: str, skill_name: str) -> Path:
     skill_dir.mkdir(parents=True, exist_ok=True)
 
     skill_path = skill_dir / "SKILL.md"
-    skill_path.write_text(skill_content, encoding="utf-8")
+    # Write alongside and rename so a crash never leaves a partial SKILL.md
+    tmp_path = skill_path.with_suffix(".md.tmp")
+    tmp_path.write_bytes(skill_content.encode("utf-8"))
+    os.replace(tmp_path, skill_path)
 
     return skill_path
 
@@ -146,9 +252,11 @@ def list_existing_skills() -> list[str]:
     if not SKILLS_DIR.exists():
         return []
 
-    skills = []
-    for path in SKILLS_DIR.iterdir():
-        if path.is_dir() and (path / "SKILL.md").exists():
-            skills.append(path.name)
-
-    return sorted(skills)
+    # scandir's DirEntry caches the file type from readdir, saving a stat per entry
+    with os.scandir(SKILLS_DIR) as entries:
+        return sorted(
+            entry.name
+            for entry in entries
+            if entry.is_dir()
+            and os.path.exists(os.path.join(entry.path, "SKILL.md"))
+        )
@@ -1,14 +1,27 @@
 """YouTube video and transcript handling using yt-dlp."""
 
 import json
+import os
 import subprocess
 import re
+import sys
+import tempfile
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterator, Optional
 
 
-@dataclass
+# Header, cue-timing, and timestamp-only lines, fused so each line is tested once
+_SKIP_RE = re.compile(r"(?:WEBVTT|Kind:|Language:|\d{2}:\d{2}|[\d\s:.>-]+\Z)")
+_TAG_RE = re.compile(r"<[^>]+>")
+# Lines made up entirely of cue tags such as <c> or <00:00:01.234>
+_TAG_ONLY_RE = re.compile(r"\s*(?:<[^>]+>\s*)+\Z")
+
+# dataclass(slots=True) needs Python 3.10; older interpreters keep __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class VideoInfo:
     """Information about a YouTube video."""
     id: str
@@ -20,8 +33,8 @@ class VideoInfo:
     thumbnail: Optional[str] = None
 
 
-def get_channel_videos(channel_url: str, limit: int = 50) -> list[VideoInfo]:
-    """Get list of videos from a YouTube channel."""
+def iter_channel_videos(channel_url: str, limit: int = 50) -> Iterator[VideoInfo]:
+    """Yield videos from a YouTube channel as yt-dlp reports them."""
     cmd = [
         "yt-dlp",
         "--flat-playlist",
@@ -30,26 +43,36 @@ def get_channel_videos(channel_url: str, limit: int = 50) -> list[VideoInfo]:
         channel_url
     ]
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        raise Exception(f"Failed to fetch channel: {result.stderr}")
-
-    videos = []
-    for line in result.stdout.strip().split("\n"):
-        if not line:
-            continue
-        data = json.loads(line)
-        videos.append(VideoInfo(
-            id=data.get("id", ""),
-            title=data.get("title", "Unknown"),
-            channel=data.get("channel", data.get("uploader", "Unknown")),
-            duration=data.get("duration") or 0,
-            view_count=data.get("view_count") or 0,
-            url=f"https://www.youtube.com/watch?v={data.get('id', '')}",
-            thumbnail=data.get("thumbnail"),
-        ))
-
-    return videos
+    # Stream stdout so each video is available as soon as its line arrives.
+    # Lines stay as bytes; json.loads decodes the UTF-8 itself. stderr goes
+    # to a temp file so a flood of warnings can't fill a pipe nobody reads.
+    with tempfile.TemporaryFile() as err, subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=err,
+    ) as proc:
+        for line in proc.stdout:
+            if not line.strip():
+                continue
+            data = json.loads(line)
+            yield VideoInfo(
+                id=data.get("id", ""),
+                title=data.get("title", "Unknown"),
+                channel=data.get("channel", data.get("uploader", "Unknown")),
+                duration=data.get("duration") or 0,
+                view_count=data.get("view_count") or 0,
+                url=f"https://www.youtube.com/watch?v={data.get('id', '')}",
+                thumbnail=data.get("thumbnail"),
+            )
+
+        if proc.wait() != 0:
+            err.seek(0)
+            raise Exception(f"Failed to fetch channel: {err.read().decode(errors='replace')}")
+
+
+def get_channel_videos(channel_url: str, limit: int = 50) -> list[VideoInfo]:
+    """Get list of videos from a YouTube channel."""
+    return list(iter_channel_videos(channel_url, limit))
 
 
 def get_video_info(video_url: str) -> VideoInfo:
@@ -61,9 +84,9 @@ def get_video_info(video_url: str) -> VideoInfo:
         video_url
     ]
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = subprocess.run(cmd, capture_output=True)
     if result.returncode != 0:
-        raise Exception(f"Failed to fetch video: {result.stderr}")
+        raise Exception(f"Failed to fetch video: {result.stderr.decode(errors='replace')}")
 
     data = json.loads(result.stdout)
     return VideoInfo(
@@ -85,71 +108,69 @@ def get_transcript(video_url: str, output_dir: Path) -> Optional[str]:
     output_dir.mkdir(parents=True, exist_ok=True)
     output_template = str(output_dir / "transcript")
 
-    # Try manual subtitles first (highest quality)
+    # Request manual and auto-generated subtitles in one run; yt-dlp
+    # writes the manual track when it exists and falls back to auto subs
     cmd = [
         "yt-dlp",
         "--write-sub",
+        "--write-auto-sub",
         "--sub-lang", "en",
         "--skip-download",
+        "--sub-format", "vtt",
         "--output", output_template,
         video_url
     ]
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    # Check for .vtt file
-    vtt_files = list(output_dir.glob("transcript*.vtt"))
-
-    if not vtt_files:
-        # Fallback to auto-generated subtitles
-        cmd = [
-            "yt-dlp",
-            "--write-auto-sub",
-            "--sub-lang", "en",
-            "--skip-download",
-            "--output", output_template,
-            video_url
-        ]
-        subprocess.run(cmd, capture_output=True, text=True)
-        vtt_files = list(output_dir.glob("transcript*.vtt"))
-
-    if not vtt_files:
+    subprocess.run(cmd, capture_output=True, text=True)
+
+    # Check for .vtt file, preferring the English track, from one listing
+    vtt_names = sorted(
+        name for name in os.listdir(output_dir)
+        if name.startswith("transcript") and name.endswith(".vtt")
+    )
+
+    if not vtt_names:
         return None
 
     # Parse VTT to plain text
-    vtt_path = vtt_files[0]
-    return parse_vtt(vtt_path)
+    vtt_name = next((name for name in vtt_names if name.endswith(".en.vtt")), vtt_names[0])
+    return parse_vtt(output_dir / vtt_name)
 
 
 def parse_vtt(vtt_path: Path) -> str:
     """Parse VTT subtitle file to plain text, removing duplicates."""
-    content = vtt_path.read_text(encoding="utf-8")
-
-    # Remove VTT header
-    lines = content.split("\n")
     text_lines = []
     seen = set()
-
-    for line in lines:
-        # Skip timestamps, headers, and empty lines
-        if not line.strip():
-            continue
-        if line.startswith("WEBVTT"):
-            continue
-        if line.startswith("Kind:") or line.startswith("Language:"):
-            continue
-        if re.match(r"^\d{2}:\d{2}", line):
-            continue
-        if re.match(r"^[\d\s:\.->]+$", line):
-            continue
-
-        # Remove HTML tags
-        clean = re.sub(r"<[^>]+>", "", line)
-        clean = clean.strip()
-
-        if clean and clean not in seen:
-            seen.add(clean)
-            text_lines.append(clean)
+    skip_match = _SKIP_RE.match
+    tag_sub = _TAG_RE.sub
+    tag_only_match = _TAG_ONLY_RE.match
+
+    # Iterate the file handle so only one line is resident at a time
+    with vtt_path.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+
+            # Skip timestamps, headers, and empty lines
+            if not line.strip():
+                continue
+            if skip_match(line):
+                continue
+
+            # Remove HTML tags, dropping tag-only cue lines before
+            # building a substituted copy of them
+            if "<" in line:
+                if tag_only_match(line):
+                    continue
+                clean = tag_sub("", line).strip()
+            else:
+                clean = line.strip()
+
+            if not clean:
+                continue
+
+            if clean not in seen:
+                seen.add(clean)
+                text_lines.append(clean)
 
     return " ".join(text_lines)
 